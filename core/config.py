@@ -1,5 +1,4 @@
 from pydantic_settings import BaseSettings
-from functools import lru_cache
 
 
 class Settings(BaseSettings):
@@ -9,11 +8,13 @@ class Settings(BaseSettings):
     # Redis
     redis_url: str = "redis://localhost:6379"
     cache_ttl: int = 86400  # 24 hours
+    memory_cache_max_entries: int = 10_000  # in-memory fallback LRU cap
 
     # UniProt
     uniprot_base_url: str = "https://rest.uniprot.org/uniprotkb/search"
     uniprot_timeout: int = 20
     uniprot_retries: int = 2
+    uniprot_cache_ttl: int = 3600  # in-process summary memo, seconds
 
     # Rate limiting
     rate_limit: str = "30/minute"
@@ -26,6 +27,9 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
 
 
-@lru_cache()
+# Loaded once at import; get_settings() hands out this shared instance
+settings = Settings()
+
+
 def get_settings() -> Settings:
-    return Settings()
+    return settings
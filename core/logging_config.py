@@ -1,37 +1,85 @@
+import atexit
 import logging
-import json
+import queue
+import threading
 import time
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
+try:
+    import orjson
+
+    def _encode(value: Any) -> bytes:
+        return orjson.dumps(value, default=str)
+except ImportError:  # pragma: no cover - stdlib fallback
+    import json
+
+    def _encode(value: Any) -> bytes:
+        return json.dumps(value, default=str).encode()
+
+
+# Standard LogRecord attributes; anything else on the record came in via extra={...}
+_RESERVED = frozenset({
+    "name", "msg", "args", "levelname", "levelno", "pathname",
+    "filename", "module", "exc_info", "exc_text", "stack_info",
+    "lineno", "funcName", "created", "msecs", "relativeCreated",
+    "thread", "threadName", "processName", "process", "message",
+    "taskName",
+})
+
 
 class JSONFormatter(logging.Formatter):
-    """Formats log records as structured JSON."""
+    """
+    Formats log records as structured JSON.
+
+    The fixed skeleton is pre-serialized once; per record only the values
+    (and any extra fields) are encoded and spliced between the pieces.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._prefix = b'{"timestamp":'
+        self._mid1 = b',"level":'
+        self._mid2 = b',"message":'
+        self._suffix = b"}"
 
     def format(self, record: logging.LogRecord) -> str:
-        log_data: dict[str, Any] = {
-            "timestamp": self.formatTime(record),
-            "level": record.levelname,
-            "message": record.getMessage(),
-        }
+        pieces = [
+            self._prefix, _encode(self.formatTime(record)),
+            self._mid1, _encode(record.levelname),
+            self._mid2, _encode(record.getMessage()),
+        ]
         # Merge any extra fields passed via extra={...}
         for key, val in record.__dict__.items():
-            if key not in {
-                "name", "msg", "args", "levelname", "levelno", "pathname",
-                "filename", "module", "exc_info", "exc_text", "stack_info",
-                "lineno", "funcName", "created", "msecs", "relativeCreated",
-                "thread", "threadName", "processName", "process", "message",
-                "taskName",
-            }:
-                log_data[key] = val
-        return json.dumps(log_data)
+            if key not in _RESERVED:
+                pieces.append(b"," + _encode(key) + b":" + _encode(val))
+        pieces.append(self._suffix)
+        return b"".join(pieces).decode()
+
+
+# Records are enqueued on the calling thread and written to stderr by a
+# single background listener, so request handling never blocks on I/O.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_listener: QueueListener | None = None
+_listener_lock = threading.Lock()
+
+
+def _ensure_listener() -> None:
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            handler = logging.StreamHandler()
+            handler.setFormatter(JSONFormatter())
+            _listener = QueueListener(_log_queue, handler)
+            _listener.start()
+            atexit.register(_listener.stop)
 
 
 def get_logger(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
     if not logger.handlers:
-        handler = logging.StreamHandler()
-        handler.setFormatter(JSONFormatter())
-        logger.addHandler(handler)
+        _ensure_listener()
+        logger.addHandler(QueueHandler(_log_queue))
         logger.setLevel(logging.INFO)
         logger.propagate = False
     return logger
@@ -42,21 +90,26 @@ def log_request(
     gene: str,
     cache_status: str,
     uniprot_status: int | None,
-    elapsed_ms: float,
+    elapsed_ns: int,
     error: str | None = None,
 ) -> None:
-    """Log a structured API request record."""
+    """
+    Log a structured API request record.
+    elapsed_ns is a time.perf_counter_ns() delta; it is only formatted when
+    the record will actually be emitted.
+    """
+    if not logger.isEnabledFor(logging.WARNING if error else logging.INFO):
+        return
+
     extra = {
         "gene": gene,
         "cache": cache_status,
         "uniprot_status": uniprot_status,
-        "time_ms": round(elapsed_ms, 1),
+        "time_ms": round(elapsed_ns / 1_000_000, 1),
     }
     if error:
         extra["error"] = error
         logger.warning("Request completed with error", extra=extra)
     else:
-        logger.info(
-            f"gene={gene} cache={cache_status} uniprot_status={uniprot_status} time={round(elapsed_ms)}ms",
-            extra=extra,
-        )
+        # Static message: the data lives in the structured extra fields
+        logger.info("request", extra=extra)
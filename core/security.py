@@ -7,12 +7,16 @@ Valid HGNC gene symbols:
   - Must NOT contain whitespace or special characters
 """
 from __future__ import annotations
-import re
 
 
-# Matches valid gene symbols: letters/digits/hyphens, starts with a letter
-_VALID_SYMBOL_RE = re.compile(r"^[A-Z][A-Z0-9\-_]{0,19}$")
-_NUMERIC_ONLY_RE = re.compile(r"^\d+$")
+# Every character a gene symbol may contain. bytes.translate(None, ...) deletes
+# them in C, so a valid symbol leaves nothing behind.
+_SYMBOL_CHARS = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_"
+_MAX_LENGTH = 20
+_INVALID = "Invalid HGNC gene symbol"
+
+# NOTE: there is deliberately no separate "purely numeric" check. A symbol
+# must start with A-Z, which already makes an all-digit symbol impossible.
 
 
 def sanitize_and_validate(raw: str) -> tuple[str, str | None]:
@@ -21,20 +25,23 @@ def sanitize_and_validate(raw: str) -> tuple[str, str | None]:
     error_message is None if valid.
     """
     if not isinstance(raw, str):
-        return "", "Invalid HGNC gene symbol"
+        return "", _INVALID
 
-    # Strip whitespace and uppercase
-    symbol = raw.strip().upper()
+    # Strip whitespace; empty or over-long input is rejected before any other
+    # work (uppercasing never shortens a string)
+    symbol = raw.strip()
+    if not 0 < len(symbol) <= _MAX_LENGTH:
+        return "", _INVALID
 
-    if not symbol:
-        return "", "Invalid HGNC gene symbol"
+    symbol = symbol.upper()
 
-    # Reject purely numeric
-    if _NUMERIC_ONLY_RE.match(symbol):
-        return "", "Invalid HGNC gene symbol"
+    # Leading letter (also rejects purely numeric input). Length is re-checked
+    # because uppercasing can expand ligatures such as "ﬀ" into plain ASCII.
+    if not "A" <= symbol[0] <= "Z" or len(symbol) > _MAX_LENGTH:
+        return "", _INVALID
 
-    # Check format
-    if not _VALID_SYMBOL_RE.match(symbol):
-        return "", "Invalid HGNC gene symbol"
+    # Check format: ASCII letters/digits/hyphens/underscores only
+    if not symbol.isascii() or symbol.encode().translate(None, _SYMBOL_CHARS):
+        return "", _INVALID
 
     return symbol, None
@@ -0,0 +1,48 @@
+"""
+Small in-process LRU map with per-entry expiry.
+
+Used by the in-memory cache fallback and the UniProt summary memo.
+"""
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class TTLCache:
+    """
+    Keeps at most max_entries values, evicting the least recently used.
+    Entries expire ttl seconds after they are set (monotonic clock).
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        # key → (value, expire_at on the monotonic clock)
+        self._data: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._max_entries = max_entries
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expire_at = entry
+        if time.monotonic() < expire_at:
+            self._data.move_to_end(key)
+            return value
+        del self._data[key]
+        return None
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self._data[key] = (value, time.monotonic() + ttl)
+        self._data.move_to_end(key)
+        while len(self._data) > self._max_entries:
+            self._data.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -5,9 +5,10 @@ from __future__ import annotations
 
 from contextlib import asynccontextmanager
 
+import httpx
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
@@ -27,7 +28,31 @@ limiter = Limiter(key_func=get_remote_address, default_limits=[settings.rate_lim
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info(f"{settings.app_name} v{settings.app_version} starting up")
+    # Pooled HTTP/2 clients for the upstream services. Keep-alive connections
+    # are reused across requests; failed connects are retried at the
+    # transport level before a service sees an error. Redirects are followed,
+    # as they were with requests.
+    app.state.http_client = httpx.AsyncClient(
+        follow_redirects=True,
+        transport=httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=2,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=10),
+        ),
+    )
+    # UniProt gets its own pool and default headers
+    app.state.uniprot_client = httpx.AsyncClient(
+        headers={"Accept": "application/json"},
+        follow_redirects=True,
+        transport=httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=2,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        ),
+    )
     yield
+    await app.state.uniprot_client.aclose()
+    await app.state.http_client.aclose()
     logger.info(f"{settings.app_name} shutting down")
 
 
@@ -40,6 +65,7 @@ app = FastAPI(
         "Strictly filtered to Homo sapiens (organism_id:9606)."
     ),
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
 )
@@ -57,23 +83,32 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+from fastapi.exception_handlers import http_exception_handler
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
 import os
 
 # ── Routes ────────────────────────────────────────────────────────────────────
 app.include_router(gene_router)
 
-# Serve Frontend
+
+@app.get("/health", tags=["Health"])
+async def health():
+    return {"status": "ok", "version": settings.app_version}
+
+
+@app.exception_handler(404)
+async def not_found(request: Request, exc):
+    # Unknown API paths get the API's JSON error shape; everything else keeps
+    # the default 404 response
+    if request.url.path.startswith("/api/"):
+        return ORJSONResponse(status_code=404, content={"error": "Not Found"})
+    return await http_exception_handler(request, exc)
+
+
+# Serve Frontend — mounted last so every API route above takes precedence
 if os.path.exists("frontend"):
     app.mount("/static", StaticFiles(directory="frontend"), name="static")
-
-    @app.get("/{full_path:path}", include_in_schema=False)
-    async def serve_frontend(full_path: str):
-        # Serve index.html for root or any non-API path
-        if not full_path.startswith("api/"):
-            return FileResponse("frontend/index.html")
-        return JSONResponse(status_code=404, content={"error": "Not Found"})
+    app.mount("/", StaticFiles(directory="frontend", html=True), name="frontend")
 else:
     @app.get("/", include_in_schema=False)
     async def root():
@@ -86,8 +121,3 @@ else:
                 "GET /api/v1/gene/{symbol}/exists",
             ],
         }
-
-
-@app.get("/health", tags=["Health"])
-async def health():
-    return {"status": "ok", "version": settings.app_version}
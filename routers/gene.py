@@ -5,8 +5,9 @@ from __future__ import annotations
 
 import time
 
+import orjson
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 
 from core.logging_config import get_logger, log_request
 from core.security import sanitize_and_validate
@@ -22,8 +23,9 @@ router = APIRouter(prefix="/api/v1/gene", tags=["Gene Summary"])
 
 @router.get(
     "/{hgnc_symbol}",
-    response_model=GeneSummaryResponse,
+    response_model=None,
     responses={
+        200: {"model": GeneSummaryResponse},
         400: {"model": ErrorResponse, "description": "Invalid gene symbol"},
         404: {"model": ErrorResponse, "description": "Gene not found"},
         503: {"model": ErrorResponse, "description": "UniProt unavailable"},
@@ -32,43 +34,44 @@ router = APIRouter(prefix="/api/v1/gene", tags=["Gene Summary"])
     description="Returns structured biological information for the given HGNC gene symbol.",
 )
 async def get_gene_summary(hgnc_symbol: str, request: Request):
-    t0 = time.perf_counter()
+    t0 = time.perf_counter_ns()
     symbol, error = sanitize_and_validate(hgnc_symbol)
 
     if error:
-        return JSONResponse(status_code=400, content={"error": error})
+        return ORJSONResponse(status_code=400, content={"error": error})
 
     # ── Cache check ──────────────────────────────────────────────────────────
-    cached = cache_service.get(symbol)
+    cached = cache_service.get_bytes(symbol)
     if cached:
-        elapsed = (time.perf_counter() - t0) * 1000
+        elapsed = time.perf_counter_ns() - t0
         log_request(logger, symbol, "HIT", None, elapsed)
-        return JSONResponse(status_code=200, content=cached)
+        return Response(content=cached, media_type="application/json")
 
     # ── UniProt fetch ────────────────────────────────────────────────────────
     try:
-        data = fetch_gene_summary(symbol)
+        data = await fetch_gene_summary(request.app.state.uniprot_client, symbol)
     except UniProtServiceError:
-        elapsed = (time.perf_counter() - t0) * 1000
+        elapsed = time.perf_counter_ns() - t0
         log_request(logger, symbol, "MISS", 503, elapsed, error="UniProt service unavailable")
-        return JSONResponse(status_code=503, content={"error": "UniProt service unavailable"})
+        return ORJSONResponse(status_code=503, content={"error": "UniProt service unavailable"})
 
     if data is None:
-        elapsed = (time.perf_counter() - t0) * 1000
+        elapsed = time.perf_counter_ns() - t0
         log_request(logger, symbol, "MISS", 200, elapsed, error="not found")
-        return JSONResponse(status_code=404, content={"error": "Human gene not found in UniProt."})
+        return ORJSONResponse(status_code=404, content={"error": "Human gene not found in UniProt."})
 
     # ── Cache store & return ─────────────────────────────────────────────────
-    cache_service.set(symbol, data)
-    elapsed = (time.perf_counter() - t0) * 1000
+    payload = cache_service.set(symbol, data)
+    elapsed = time.perf_counter_ns() - t0
     log_request(logger, symbol, "MISS", 200, elapsed)
-    return JSONResponse(status_code=200, content=data)
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get(
     "/{hgnc_symbol}/exists",
-    response_model=ExistsResponse,
+    response_model=None,
     responses={
+        200: {"model": ExistsResponse},
         400: {"model": ErrorResponse, "description": "Invalid gene symbol"},
         503: {"model": ErrorResponse, "description": "UniProt unavailable"},
     },
@@ -76,26 +79,26 @@ async def get_gene_summary(hgnc_symbol: str, request: Request):
     description="Returns whether the gene exists as a reviewed human entry in UniProt.",
 )
 async def check_gene_exists(hgnc_symbol: str, request: Request):
-    t0 = time.perf_counter()
+    t0 = time.perf_counter_ns()
     symbol, error = sanitize_and_validate(hgnc_symbol)
     if error:
-        return JSONResponse(status_code=400, content={"error": error})
+        return ORJSONResponse(status_code=400, content={"error": error})
 
     # Check cache first
-    cached = cache_service.get(symbol)
+    cached = cache_service.get_bytes(symbol)
     if cached is not None:
-        elapsed = (time.perf_counter() - t0) * 1000
+        elapsed = time.perf_counter_ns() - t0
         log_request(logger, symbol, "HIT", None, elapsed)
         return {"exists": True}
 
     try:
-        exists = gene_exists(symbol)
+        exists = await gene_exists(request.app.state.uniprot_client, symbol)
     except UniProtServiceError:
-        elapsed = (time.perf_counter() - t0) * 1000
+        elapsed = time.perf_counter_ns() - t0
         log_request(logger, symbol, "MISS", 503, elapsed, error="UniProt unavailable")
-        return JSONResponse(status_code=503, content={"error": "UniProt service unavailable"})
+        return ORJSONResponse(status_code=503, content={"error": "UniProt service unavailable"})
 
-    elapsed = (time.perf_counter() - t0) * 1000
+    elapsed = time.perf_counter_ns() - t0
     log_request(logger, symbol, "MISS", 200, elapsed)
     return {"exists": exists}
 
@@ -105,8 +108,9 @@ SIGNOR_CACHE_PREFIX = "signor_v1:"
 
 @router.get(
     "/{hgnc_symbol}/signor",
-    response_model=SignorDataResponse,
+    response_model=None,
     responses={
+        200: {"model": SignorDataResponse},
         400: {"model": ErrorResponse, "description": "Invalid gene symbol"},
         404: {"model": ErrorResponse, "description": "Gene not found or no SIGNOR data"},
         503: {"model": ErrorResponse, "description": "SIGNOR API unavailable"},
@@ -115,52 +119,56 @@ SIGNOR_CACHE_PREFIX = "signor_v1:"
     description="Returns signaling interaction data from the SIGNOR database for the given gene.",
 )
 async def get_signor_data(hgnc_symbol: str, request: Request):
-    t0 = time.perf_counter()
+    t0 = time.perf_counter_ns()
     symbol, error = sanitize_and_validate(hgnc_symbol)
     if error:
-        return JSONResponse(status_code=400, content={"error": error})
+        return ORJSONResponse(status_code=400, content={"error": error})
 
-    # ── SIGNOR cache check ───────────────────────────────────────────────────
+    # ── SIGNOR + gene summary cache check (one round-trip) ──────────────────
     signor_key = f"{SIGNOR_CACHE_PREFIX}{symbol}"
-    cached = cache_service.get_raw(signor_key)
+    cached, cached_gene = cache_service.mget_bytes([signor_key, cache_service.key_for(symbol)])
     if cached:
-        elapsed = (time.perf_counter() - t0) * 1000
+        elapsed = time.perf_counter_ns() - t0
         log_request(logger, symbol, "HIT", None, elapsed)
-        return JSONResponse(status_code=200, content=cached)
+        return Response(content=cached, media_type="application/json")
 
     # ── Resolve UniProt accession ────────────────────────────────────────────
-    gene_data = cache_service.get(symbol)
+    gene_data = orjson.loads(cached_gene) if cached_gene else None
     if not gene_data:
         try:
-            gene_data = fetch_gene_summary(symbol)
+            gene_data = await fetch_gene_summary(request.app.state.uniprot_client, symbol)
         except UniProtServiceError:
             pass
+        else:
+            # Keep the summary so the next accession lookup (and /gene) skips UniProt
+            if gene_data:
+                cache_service.set(symbol, gene_data)
 
     if not gene_data or not gene_data.get("uniprot_accession"):
-        elapsed = (time.perf_counter() - t0) * 1000
+        elapsed = time.perf_counter_ns() - t0
         log_request(logger, symbol, "MISS", 404, elapsed, error="gene not found")
-        return JSONResponse(status_code=404, content={"error": "Gene not found in UniProt."})
+        return ORJSONResponse(status_code=404, content={"error": "Gene not found in UniProt."})
 
     accession = gene_data["uniprot_accession"]
 
     # ── SIGNOR fetch ─────────────────────────────────────────────────────────
     try:
-        data = fetch_signor_data(accession)
+        data = await fetch_signor_data(request.app.state.http_client, accession)
     except SignorServiceError:
-        elapsed = (time.perf_counter() - t0) * 1000
+        elapsed = time.perf_counter_ns() - t0
         log_request(logger, symbol, "MISS", 503, elapsed, error="SIGNOR unavailable")
-        return JSONResponse(status_code=503, content={"error": "SIGNOR service unavailable"})
+        return ORJSONResponse(status_code=503, content={"error": "SIGNOR service unavailable"})
 
     if data is None:
-        elapsed = (time.perf_counter() - t0) * 1000
+        elapsed = time.perf_counter_ns() - t0
         log_request(logger, symbol, "MISS", 404, elapsed, error="no SIGNOR data")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={"interactions": [], "modifications": [], "entity_name": "", "total_relations": 0},
         )
 
     # ── Cache & return ───────────────────────────────────────────────────────
-    cache_service.set_raw(signor_key, data)
-    elapsed = (time.perf_counter() - t0) * 1000
+    payload = cache_service.set_raw(signor_key, data)
+    elapsed = time.perf_counter_ns() - t0
     log_request(logger, symbol, "MISS", 200, elapsed)
-    return JSONResponse(status_code=200, content=data)
+    return Response(content=payload, media_type="application/json")
@@ -0,0 +1,436 @@
+# mypy: disallow-untyped-defs
+"""
+UniProt entry normalisation.
+
+Pure functions that turn a raw UniProt JSON entry into the
+GeneSummaryResponse dict. Kept free of I/O and fully annotated so the module
+can be compiled with mypyc (see README); the plain Python source is used when
+no compiled build is present.
+"""
+from __future__ import annotations
+
+import re
+from operator import itemgetter
+from typing import Any, Iterator, Optional, Sequence
+
+
+# Evidence tags stripped from free text by _clean_text:
+#   (PubMed:123, PubMed:456)  {ECO:0000269|PubMed:1234567}  [PubMed:1234567]  (ECO:0000269)
+_EVIDENCE_TAG_RE = re.compile(r"\s*(?:\(PubMed:[^)]+\)|\{ECO:[^}]+\}|\[PubMed:[^\]]+\]|\(ECO:[^)]+\))")
+_MULTI_SPACE_RE = re.compile(r"\s{2,}")
+
+# URL prefixes for expression cross-references, completed with the xref ID
+_EXPRESSION_LINK_BASES: dict[str, str] = {
+    "Bgee": "https://bgee.org/?page=gene&gene_id=",
+    "HPA": "https://www.proteinatlas.org/",
+    "ExpressionAtlas": "https://www.ebi.ac.uk/gxa/genes/",
+}
+
+# URL prefixes for linked records; IDs are appended by plain concatenation
+_PUBMED_URL = "https://pubmed.ncbi.nlm.nih.gov/"
+_RCSB_URL = "https://www.rcsb.org/structure/"
+_ALPHAFOLD_URL = "https://alphafold.ebi.ac.uk/entry/"
+_REACTOME_URL = "https://reactome.org/PathwayBrowser/#/"
+_SIGNOR_URL = "https://signor.uniroma2.it/relation_result.php?id="
+
+# Sort keys, implemented in C instead of per-item lambdas
+_POSITION = itemgetter("position")
+_FIRST = itemgetter(0)
+
+# Shared reference map for entries without citations; never mutated
+_EMPTY_REF_MAP: dict[str, dict[str, Any]] = {"by_num": {}, "by_id": {}}
+
+# Shared sections for entries with nothing to report; never mutated. Empty
+# sequences are tuples, which serialize to the same JSON arrays.
+_EMPTY_FUNCTION: dict[str, Any] = {"general_function": "", "subsections": (), "references": ()}
+_EMPTY_EXPRESSION: dict[str, Any] = {
+    "tissue_specificity": "",
+    "developmental_stage": "",
+    "induction": "",
+    "external_links": (),
+}
+_EMPTY_PTM: dict[str, Any] = {"description": "", "sites": (), "external_links": ()}
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# Normalisation Engine (Phase 3)
+# ────────────────────────────────────────────────────────────────────────────
+
+def _normalize(gene_symbol: str, entry: dict[str, Any]) -> dict[str, Any]:
+    acc = entry.get("primaryAccession", "")
+    
+    # Pre-parse citations for performance
+    ref_map = _build_reference_map(entry)
+    # Bucket comments by type and cross-references by database once instead
+    # of rescanning them per section
+    comments = _bin_comments(entry)
+    xrefs = _bin_xrefs(entry)
+
+    return {
+        "gene_symbol": gene_symbol.upper(),
+        "uniprot_accession": acc,
+        "entry_status": entry.get("entryType", ""),
+        "annotation_score": str(entry.get("annotationScore", "")),
+        "organism": (entry.get("organism") or {}).get("scientificName") or "Homo sapiens",
+        
+        "identification": _extract_identification(entry),
+        "function": _extract_function(comments, ref_map),
+        "expression": _extract_expression(comments, xrefs),
+        "ptm": _extract_ptm(entry, comments, ref_map),
+        "variants": _extract_variants(entry, ref_map),
+        "structure": _extract_structure(acc, xrefs),
+        "sequence": {
+            "length": entry.get("sequence", {}).get("length", 0),
+            "sequence": entry.get("sequence", {}).get("value", "")
+        },
+        "reactome": _extract_reactome(xrefs.get("Reactome", ())),
+        "signor": _extract_signor(xrefs.get("SIGNOR", ()))
+    }
+
+
+def _bin_comments(entry: dict[str, Any]) -> dict[str, list[Any]]:
+    """Groups the entry's comments by commentType, preserving their order."""
+    buckets: dict[str, list[Any]] = {}
+    for c in entry.get("comments", []):
+        buckets.setdefault(c.get("commentType", ""), []).append(c)
+    return buckets
+
+
+def _bin_xrefs(entry: dict[str, Any]) -> dict[str, list[Any]]:
+    """Groups the entry's cross-references by database, preserving their order."""
+    buckets: dict[str, list[Any]] = {}
+    for x in entry.get("uniProtKBCrossReferences", []):
+        buckets.setdefault(x.get("database", ""), []).append(x)
+    return buckets
+
+
+def _build_reference_map(entry: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Maps referenceNumber and pubmed_id to parsed citation data."""
+    refs = entry.get("references")
+    if not refs:
+        return _EMPTY_REF_MAP
+
+    # Both maps are filled through locals and wrapped once at the end
+    by_num: dict[Any, dict[str, Any]] = {}
+    by_id: dict[Any, dict[str, Any]] = {}
+    for ref in refs:
+        citation = ref.get("citation", {})
+        pub_id = next(
+            (x.get("id", "") for x in citation.get("citationCrossReferences", ()) if x.get("database") == "PubMed"),
+            "",
+        )
+
+        info = {
+            "pubmed_id": pub_id,
+            "title": citation.get("title", "No title available"),
+            "url": _PUBMED_URL + pub_id + "/" if pub_id else ""
+        }
+        cid = ref.get("referenceNumber")
+        if cid:
+            by_num[cid] = info
+        if pub_id:
+            by_id[pub_id] = info
+    return {"by_num": by_num, "by_id": by_id}
+
+
+def _iter_evidences(evidences: Optional[list[Any]], ref_map: dict[str, dict[str, Any]]) -> Iterator[dict[str, Any]]:
+    """
+    Yields the PubMed references behind a list of UniProt evidence tags.
+    References may repeat; callers deduplicate by pubmed_id.
+    """
+    by_num = ref_map["by_num"]
+    by_id = ref_map["by_id"]
+    for ev in evidences or ():
+        try:
+            source = ev.get("source")
+            if source == "PubMed":
+                pub_id = ev.get("id")
+                # Try to find in our pre-built map to get the title
+                ref = by_id.get(pub_id)
+                if not ref and pub_id:
+                    ref = {
+                        "pubmed_id": pub_id,
+                        "title": f"PubMed Record {pub_id}",
+                        "url": _PUBMED_URL + pub_id + "/"
+                    }
+            else:
+                ref = by_num.get(source.get("referenceNumber"))
+        except AttributeError:
+            # Malformed evidence, or a non-PubMed string source
+            continue
+
+        if ref and ref["pubmed_id"]:
+            yield ref
+
+
+def _unique_refs(evidences: Optional[list[Any]], ref_map: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+    """PubMed references for the evidence tags, first occurrence of each ID kept."""
+    refs: list[dict[str, Any]] = []
+    seen: set[str] = set()
+    for ref in _iter_evidences(evidences, ref_map):
+        pid = ref["pubmed_id"]
+        if pid not in seen:
+            seen.add(pid)
+            refs.append(ref)
+    return refs
+
+
+def _extract_identification(entry: dict[str, Any]) -> dict[str, Any]:
+    prot = entry.get("proteinDescription", {})
+    rec = prot.get("recommendedName", {})
+    
+    alt_names: list[str] = []
+    for alt in prot.get("alternativeNames", []):
+        v = (alt.get("fullName") or {}).get("value", "")
+        if v: alt_names.append(v)
+
+    genes = entry.get("genes", [])
+    primary = ""
+    synonyms: list[str] = []
+    for g in genes:
+        if not primary:
+            primary = (g.get("geneName") or {}).get("value", "")
+        for syn in g.get("synonyms", []):
+            v = syn.get("value", "")
+            if v: synonyms.append(v)
+
+    return {
+        "primary_gene": primary,
+        "synonyms": synonyms,
+        "alternative_protein_names": alt_names,
+        "length": entry.get("sequence", {}).get("length", 0)
+    }
+
+
+def _extract_function(comments: dict[str, list[Any]], ref_map: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    function_comments = comments.get("FUNCTION", ())
+    location_comments = comments.get("SUBCELLULAR LOCATION", ())
+    if not function_comments and not location_comments:
+        return _EMPTY_FUNCTION
+
+    general = ""
+    subsections: list[dict[str, str]] = []
+    refs: list[dict[str, Any]] = []
+    seen_refs: set[str] = set()
+    all_locations: list[str] = []
+    seen_notes: set[str] = set()
+
+    for c in function_comments:
+        texts = c.get("texts", [])
+        for t in texts:
+            val = t.get("value", "")
+            if val:
+                cleaned_val = _clean_text(val)
+                if not general: 
+                    general = cleaned_val
+                elif cleaned_val not in seen_notes:
+                    subsections.append({"title": "Note", "content": cleaned_val})
+                    seen_notes.add(cleaned_val)
+            # Extract refs linked to this function, deduplicated by PubMed ID
+            for ev_ref in _iter_evidences(t.get("evidences"), ref_map):
+                pid = ev_ref["pubmed_id"]
+                if pid not in seen_refs:
+                    seen_refs.add(pid)
+                    refs.append(ev_ref)
+
+    for c in location_comments:
+        for loc in c.get("subcellularLocations", []):
+            v = (loc.get("location") or {}).get("value", "")
+            if v and v not in all_locations: 
+                all_locations.append(v)
+
+    if all_locations:
+        subsections.append({
+            "title": "Subcellular Location", 
+            "content": ", ".join(all_locations)
+        })
+
+    return {
+        "general_function": general,
+        "subsections": subsections,
+        "references": refs
+    }
+
+
+def _extract_expression(comments: dict[str, list[Any]], xrefs: dict[str, list[Any]]) -> dict[str, Any]:
+    tissue_comments = comments.get("TISSUE SPECIFICITY", ())
+    dev_comments = comments.get("DEVELOPMENTAL STAGE", ())
+    induc_comments = comments.get("INDUCTION", ())
+    if not (tissue_comments or dev_comments or induc_comments) and xrefs.keys().isdisjoint(_EXPRESSION_LINK_BASES):
+        return _EMPTY_EXPRESSION
+
+    # The last comment of each type with any text wins
+    tissue = _last_comment_text(tissue_comments)
+    dev = _last_comment_text(dev_comments)
+    induc = _last_comment_text(induc_comments)
+
+    # External Links - Exclude ProteomicsDB as requested
+    links: list[dict[str, str]] = []
+    for db, base in _EXPRESSION_LINK_BASES.items():
+        for xref in xrefs.get(db, ()):
+            links.append({"database": db, "url": base + xref.get("id", "")})
+
+    return {
+        "tissue_specificity": tissue,
+        "developmental_stage": dev,
+        "induction": induc,
+        "external_links": links
+    }
+
+
+def _last_comment_text(comments: Sequence[Any]) -> str:
+    """Cleaned first text of the last comment that has any text."""
+    for c in reversed(comments):
+        for t in c.get("texts", []):
+            if t.get("value"):
+                return _clean_text(t["value"])
+    return ""
+
+
+def _extract_ptm(
+    entry: dict[str, Any], comments: dict[str, list[Any]], ref_map: dict[str, dict[str, Any]]
+) -> dict[str, Any]:
+    ptm_comments = comments.get("PTM")
+    features = entry.get("features")
+    if not ptm_comments and not features:
+        return _EMPTY_PTM
+
+    desc = ""
+    if ptm_comments:
+        c = ptm_comments[0]
+        desc = " ".join([_clean_text(t.get("value", "")) for t in c.get("texts", []) if t.get("value")])
+    
+    sites: list[dict[str, Any]] = []
+    for f in features or ():
+        if f.get("type") == "Modified residue":
+            f_desc = f.get("description", "")
+            sites.append({
+                "position": f.get("location", {}).get("start", {}).get("value", 0),
+                "residue": f_desc.partition(";")[0], # e.g. "Phosphoserine"
+                "type": f_desc,
+                "references": _unique_refs(f.get("evidences"), ref_map)
+            })
+    
+    return {
+        "description": desc,
+        "sites": sorted(sites, key=_POSITION),
+        "external_links": []
+    }
+
+
+def _extract_variants(entry: dict[str, Any], ref_map: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+    variants: list[dict[str, Any]] = []
+    for f in entry.get("features", []):
+        if f.get("type") != "Natural variant": continue
+        
+        pos = f.get("location", {}).get("start", {}).get("value", 0)
+        desc = f.get("description", "")
+        desc_l = desc.lower()
+        
+        # Parse ClinVar/dbSNP from xrefs in feature if present
+        cv_id = ""
+        ds_id = ""
+        # In modern UniProt JSON, variant xrefs are sometimes inside the feature
+        # but often we need to check the global xrefs for ClinVar/dbSNP mappings
+        
+        v_ref = _unique_refs(f.get("evidences"), ref_map)
+        
+        variants.append({
+            "position": pos,
+            "from": f.get("alternativeSequence", {}).get("originalSequence", ""),
+            "to": f.get("alternativeSequence", {}).get("alternativeSequences", [""])[0],
+            "description": desc,
+            "disease": desc.partition("(in")[0].strip() if "(in" in desc else "",
+            "clinical_significance": "Disease" if "pathogenic" in desc_l or "disease" in desc_l else "Unknown",
+            "references": v_ref,
+            "clinvar_id": cv_id,
+            "dbsnp_id": ds_id
+        })
+    
+    return sorted(variants, key=_POSITION)
+
+
+def _extract_structure(acc: str, xrefs: dict[str, list[Any]]) -> dict[str, Any]:
+    af_link = ""
+    
+    if acc:
+        af_link = _ALPHAFOLD_URL + acc
+
+    pdb_xrefs = xrefs.get("PDB")
+    if not pdb_xrefs:
+        return {"pdb_structures": (), "alphafold_link": af_link}
+
+    pdb_list: list[tuple[float, dict[str, Any]]] = []
+    for xref in pdb_xrefs:
+        method = ""
+        res_str = ""
+        for p in xref.get("properties", []):
+            key = p.get("key")
+            val = p.get("value")
+            if key == "Method": method = val
+            elif key == "Resolution": res_str = val
+
+        pid = xref.get("id", "")
+        
+        # Parse resolution for sorting
+        res_val = float('inf') # Default for N/A or unparseable
+        if res_str and res_str != "N/A":
+            try:
+                # Assuming resolution is like "2.5 A"
+                res_val = float(res_str.split(' ')[0])
+            except ValueError:
+                pass # Keep as inf if parsing fails
+
+        # Paired with its sort key so the dict never carries internal fields
+        pdb_list.append((res_val, {
+            "pdb_id": pid,
+            "method": method or "X-ray",
+            "resolution": res_str or "N/A",
+            "link": _RCSB_URL + pid,
+        }))
+    
+    # Sort PDB structures by resolution (lower is better)
+    pdb_list.sort(key=_FIRST)
+
+    return {
+        "pdb_structures": [pdb for _, pdb in pdb_list],
+        "alphafold_link": af_link
+    }
+
+
+def _extract_reactome(xrefs: Sequence[Any]) -> list[dict[str, Any]]:
+    reactome_list: list[dict[str, Any]] = []
+    for xref in xrefs:
+        pathway_id = xref.get("id", "")
+        pathway_name = ""
+        for p in xref.get("properties", []):
+            if p.get("key") == "PathwayName":
+                pathway_name = p.get("value", "")
+                break
+        
+        reactome_list.append({
+            "pathway_id": pathway_id,
+            "pathway_name": _clean_text(pathway_name),
+            "url": _REACTOME_URL + pathway_id
+        })
+    return reactome_list
+
+
+def _extract_signor(xrefs: Sequence[Any]) -> list[dict[str, Any]]:
+    signor_list: list[dict[str, Any]] = []
+    for xref in xrefs:
+        signor_id = xref.get("id", "")
+        if signor_id:
+            signor_list.append({
+                "signor_id": signor_id,
+                "url": _SIGNOR_URL + signor_id
+            })
+    return signor_list
+
+
+def _clean_text(text: str) -> str:
+    """Removes UniProt evidence tags like (PubMed:123), {ECO:123}, etc."""
+    if not text: return ""
+    # Strip all evidence tags in one pass, then collapse runs of whitespace
+    return _MULTI_SPACE_RE.sub(" ", _EVIDENCE_TAG_RE.sub("", text)).strip()
+
@@ -1,16 +1,19 @@
 """
 Redis-backed cache with an in-memory dict fallback when Redis is unavailable.
+
+Values are stored as serialized JSON bytes so cache hits can be written
+straight into the HTTP response without a decode/re-encode round-trip.
 """
 from __future__ import annotations
 
-import json
-import time
-from typing import Any, Optional
+from typing import Optional
 
+import orjson
 import redis
 
 from core.config import get_settings
 from core.logging_config import get_logger
+from core.ttl_cache import TTLCache
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -21,12 +24,13 @@ CACHE_PREFIX = "gene_summary:v2"
 class CacheService:
     def __init__(self) -> None:
         self._redis: Optional[redis.Redis] = None
-        self._memory: dict[str, tuple[Any, float]] = {}  # key → (value, expire_at)
+        # In-memory fallback, evicting least recently used entries past the cap
+        self._memory = TTLCache(settings.memory_cache_max_entries)
         self._connect()
 
     def _connect(self) -> None:
         try:
-            self._redis = redis.from_url(settings.redis_url, decode_responses=True, socket_connect_timeout=2)
+            self._redis = redis.from_url(settings.redis_url, decode_responses=False, socket_connect_timeout=2)
             self._redis.ping()
             logger.info("Redis cache connected", extra={"backend": "redis"})
         except Exception as exc:
@@ -38,81 +42,80 @@ class CacheService:
 
     # ------------------------------------------------------------------ #
 
-    def _key(self, gene_symbol: str) -> str:
+    def key_for(self, gene_symbol: str) -> str:
+        """Cache key of a gene summary, for use with the raw-key methods."""
         return f"{CACHE_PREFIX}{gene_symbol.upper()}"
 
-    def get(self, gene_symbol: str) -> Optional[dict]:
-        key = self._key(gene_symbol)
-
+    def _read(self, key: str) -> Optional[bytes]:
         if self._redis:
             try:
                 raw = self._redis.get(key)
                 if raw:
-                    return json.loads(raw)
+                    return raw
             except Exception as exc:
                 logger.warning("Redis GET error", extra={"error": str(exc)})
                 self._redis = None  # fall through to memory
 
-        # In-memory fallback
-        if key in self._memory:
-            value, expire_at = self._memory[key]
-            if time.time() < expire_at:
-                return value
-            del self._memory[key]
-        return None
+        return self._memory.get(key)
 
-    def set(self, gene_symbol: str, data: dict, ttl: int = settings.cache_ttl) -> None:
-        key = self._key(gene_symbol)
-        serialized = json.dumps(data)
+    def _write(self, key: str, data: dict, ttl: int) -> bytes:
+        payload = orjson.dumps(data)
 
         if self._redis:
             try:
-                self._redis.setex(key, ttl, serialized)
-                return
+                self._redis.setex(key, ttl, payload)
+                return payload
             except Exception as exc:
                 logger.warning("Redis SET error", extra={"error": str(exc)})
                 self._redis = None
 
-        # In-memory fallback
-        self._memory[key] = (data, time.time() + ttl)
+        self._memory.set(key, payload, ttl)
+        return payload
+
+    # ------------------------------------------------------------------ #
+
+    def get_bytes(self, gene_symbol: str) -> Optional[bytes]:
+        """Cached gene summary as serialized JSON, ready to send as-is."""
+        return self._read(self.key_for(gene_symbol))
+
+    def get(self, gene_symbol: str) -> Optional[dict]:
+        raw = self.get_bytes(gene_symbol)
+        return orjson.loads(raw) if raw else None
+
+    def set(self, gene_symbol: str, data: dict, ttl: int = settings.cache_ttl) -> bytes:
+        """Cache a gene summary; returns the serialized payload."""
+        return self._write(self.key_for(gene_symbol), data, ttl)
 
     def delete(self, gene_symbol: str) -> None:
-        key = self._key(gene_symbol)
+        key = self.key_for(gene_symbol)
         if self._redis:
             try:
                 self._redis.delete(key)
             except Exception:
                 pass
-        self._memory.pop(key, None)
+        self._memory.pop(key)
+
+    def get_raw_bytes(self, key: str) -> Optional[bytes]:
+        return self._read(key)
 
     def get_raw(self, key: str) -> Optional[dict]:
-        if self._redis:
-            try:
-                raw = self._redis.get(key)
-                if raw:
-                    return json.loads(raw)
-            except Exception as exc:
-                logger.warning("Redis GET error", extra={"error": str(exc)})
-                self._redis = None
+        raw = self.get_raw_bytes(key)
+        return orjson.loads(raw) if raw else None
 
-        if key in self._memory:
-            value, expire_at = self._memory[key]
-            if time.time() < expire_at:
-                return value
-            del self._memory[key]
-        return None
+    def set_raw(self, key: str, data: dict, ttl: int = settings.cache_ttl) -> bytes:
+        return self._write(key, data, ttl)
 
-    def set_raw(self, key: str, data: dict, ttl: int = settings.cache_ttl) -> None:
-        serialized = json.dumps(data)
+    def mget_bytes(self, keys: list[str]) -> list[Optional[bytes]]:
+        """Fetch several raw keys in a single Redis round-trip (MGET)."""
+        values: list[Optional[bytes]] = [None] * len(keys)
         if self._redis:
             try:
-                self._redis.setex(key, ttl, serialized)
-                return
+                values = self._redis.mget(keys)
             except Exception as exc:
-                logger.warning("Redis SET error", extra={"error": str(exc)})
+                logger.warning("Redis MGET error", extra={"error": str(exc)})
                 self._redis = None
 
-        self._memory[key] = (data, time.time() + ttl)
+        return [raw or self._memory.get(key) for key, raw in zip(keys, values)]
 
 
 # Singleton instance
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from typing import Optional
 
-import requests
+import httpx
 
 from core.config import get_settings
 from core.logging_config import get_logger
@@ -29,33 +29,61 @@ TSV_COLUMNS = [
     "signor_id", "score",
 ]
 
+# Positional indexes into a parsed row for the columns we actually read
+_COLUMN_INDEX = {name: i for i, name in enumerate(TSV_COLUMNS)}
+IDX_ENTITY_A = _COLUMN_INDEX["entity_a"]
+IDX_TYPE_A = _COLUMN_INDEX["type_a"]
+IDX_ID_A = _COLUMN_INDEX["id_a"]
+IDX_ENTITY_B = _COLUMN_INDEX["entity_b"]
+IDX_TYPE_B = _COLUMN_INDEX["type_b"]
+IDX_ID_B = _COLUMN_INDEX["id_b"]
+IDX_EFFECT = _COLUMN_INDEX["effect"]
+IDX_MECHANISM = _COLUMN_INDEX["mechanism"]
+IDX_RESIDUE = _COLUMN_INDEX["residue"]
+IDX_SEQUENCE = _COLUMN_INDEX["sequence"]
+IDX_PMID = _COLUMN_INDEX["pmid"]
+IDX_SENTENCE = _COLUMN_INDEX["sentence"]
+IDX_SIGNOR_ID = _COLUMN_INDEX["signor_id"]
+IDX_SCORE = _COLUMN_INDEX["score"]
+
+# Slots of an aggregated interaction group, kept as a small mutable list
+(
+    _G_ENTITY_A, _G_TYPE_A, _G_ID_A,
+    _G_ENTITY_B, _G_TYPE_B, _G_ID_B,
+    _G_EFFECT, _G_MECHANISM, _G_SCORE,
+    _G_PMIDS, _G_SENTENCES, _G_SIGNOR_ID,
+) = range(12)
+
 
 class SignorServiceError(Exception):
     pass
 
 
-def fetch_signor_data(uniprot_accession: str) -> Optional[dict]:
+async def fetch_signor_data(client: httpx.AsyncClient, uniprot_accession: str) -> Optional[dict]:
     """
     Query SIGNOR for all interactions involving the given UniProt accession.
     Returns a structured dict with interactions, modifications, and metadata,
     or None if no data is found.
     """
-    rows = _fetch_tsv(uniprot_accession)
+    rows = await _fetch_tsv(client, uniprot_accession)
     if not rows:
         return None
     return _structure_response(rows, uniprot_accession)
 
 
-def _fetch_tsv(accession: str) -> list[dict]:
-    """Call SIGNOR getData.php and parse the TSV into a list of row dicts."""
+async def _fetch_tsv(client: httpx.AsyncClient, accession: str) -> list[list[str]]:
+    """
+    Call SIGNOR getData.php and parse the TSV into rows of fields, padded to
+    len(TSV_COLUMNS) and addressed by the IDX_* constants.
+    """
     try:
-        resp = requests.get(
+        resp = await client.get(
             SIGNOR_BASE,
             params={"organism": "9606", "id": accession},
             timeout=10,
         )
         resp.raise_for_status()
-    except requests.RequestException as exc:
+    except httpx.HTTPError as exc:
         logger.error("SIGNOR fetch failed", extra={"accession": accession, "error": str(exc)})
         raise SignorServiceError(f"SIGNOR API unavailable: {exc}") from exc
 
@@ -63,130 +91,113 @@ def _fetch_tsv(accession: str) -> list[dict]:
     if not text:
         return []
 
-    rows = []
-    for line in text.split("\n"):
-        parts = line.split("\t")
-        if len(parts) < 22:
-            continue
-        while len(parts) < len(TSV_COLUMNS):
-            parts.append("")
-        row = dict(zip(TSV_COLUMNS, parts))
-        rows.append(row)
-    return rows
+    ncols = len(TSV_COLUMNS)
+    return [
+        parts + [""] * (ncols - len(parts))
+        for parts in (line.split("\t") for line in text.split("\n"))
+        if len(parts) >= 22
+    ]
 
 
-def _structure_response(rows: list[dict], accession: str) -> dict:
-    """Transform raw TSV rows into the API response structure."""
-    entity_name = _resolve_entity_name(rows, accession)
-    interactions = _build_interactions(rows)
-    modifications = _build_modifications(rows, accession)
+def _structure_response(rows: list[list[str]], accession: str) -> dict:
+    """
+    Transform raw TSV rows into the API response structure.
+
+    The entity name, the interaction groups and the modification sites are
+    all collected in a single pass over the rows.
+    """
+    entity_name: Optional[str] = None
+    groups: dict[tuple, list] = {}
+    seen_mods = set()
+    modifications = []
+
+    for r in rows:
+        id_b = r[IDX_ID_B]
+
+        # ── Entity name: taken from the first row mentioning the accession
+        if entity_name is None:
+            if r[IDX_ID_A] == accession:
+                entity_name = r[IDX_ENTITY_A]
+            elif id_b == accession:
+                entity_name = r[IDX_ENTITY_B]
+
+        # ── Interactions: dedupe by (entity_a, entity_b, effect, mechanism),
+        #    aggregate PMIDs and keep the highest score per group
+        key = (r[IDX_ENTITY_A], r[IDX_ENTITY_B], r[IDX_EFFECT], r[IDX_MECHANISM])
+        score = _safe_float(r[IDX_SCORE])
+
+        g = groups.get(key)
+        if g is None:
+            groups[key] = g = [
+                r[IDX_ENTITY_A], r[IDX_TYPE_A], r[IDX_ID_A],
+                r[IDX_ENTITY_B], r[IDX_TYPE_B], id_b,
+                r[IDX_EFFECT], r[IDX_MECHANISM], score,
+                set(), [], r[IDX_SIGNOR_ID],
+            ]
+        elif score > g[_G_SCORE]:
+            g[_G_SCORE] = score
+
+        # A sentence is kept for each newly seen PMID, up to three per group;
+        # the sentence column is only touched while there is room for it
+        pmid = r[IDX_PMID].strip()
+        if pmid:
+            pmids = g[_G_PMIDS]
+            if pmid not in pmids:
+                pmids.add(pmid)
+                sentences = g[_G_SENTENCES]
+                if len(sentences) < 3:
+                    sentence = r[IDX_SENTENCE].strip()
+                    if sentence:
+                        sentences.append(sentence)
+
+        # ── Modifications: unique sites where the queried protein is the
+        #    target (entity_b) and residue + mechanism are present
+        if id_b == accession:
+            residue = r[IDX_RESIDUE].strip()
+            mechanism = r[IDX_MECHANISM].strip()
+            if residue and mechanism:
+                dedup_key = (r[IDX_ENTITY_A], residue, mechanism)
+                if dedup_key not in seen_mods:
+                    seen_mods.add(dedup_key)
+                    modifications.append({
+                        "modifier": r[IDX_ENTITY_A],
+                        "residue": residue,
+                        "sequence": r[IDX_SEQUENCE].strip(),
+                        "effect": r[IDX_EFFECT].strip(),
+                        "mechanism": mechanism,
+                    })
 
     return {
-        "entity_name": entity_name,
+        "entity_name": accession if entity_name is None else entity_name,
         "total_relations": len(rows),
-        "interactions": interactions,
+        "interactions": _finalize_interactions(groups),
         "modifications": modifications,
     }
 
 
-def _resolve_entity_name(rows: list[dict], accession: str) -> str:
-    for row in rows:
-        if row["id_a"] == accession:
-            return row["entity_a"]
-        if row["id_b"] == accession:
-            return row["entity_b"]
-    return accession
-
-
-def _build_interactions(rows: list[dict]) -> list[dict]:
-    """
-    Deduplicate rows by (entity_a, entity_b, effect, mechanism) and
-    aggregate PMIDs, keeping the highest score per group.
-    """
-    groups: dict[tuple, dict] = {}
-
-    for row in rows:
-        key = (row["entity_a"], row["entity_b"], row["effect"], row["mechanism"])
-        score = _safe_float(row.get("score", ""))
-
-        if key not in groups:
-            groups[key] = {
-                "entity_a": row["entity_a"],
-                "type_a": row["type_a"],
-                "id_a": row["id_a"],
-                "entity_b": row["entity_b"],
-                "type_b": row["type_b"],
-                "id_b": row["id_b"],
-                "effect": row["effect"],
-                "mechanism": row["mechanism"],
-                "score": score,
-                "pmids": set(),
-                "sentences": [],
-                "signor_id": row["signor_id"],
-            }
-        else:
-            groups[key]["score"] = max(groups[key]["score"], score)
-
-        pmid = row.get("pmid", "").strip()
-        if pmid and pmid not in groups[key]["pmids"]:
-            groups[key]["pmids"].add(pmid)
-            sentence = row.get("sentence", "").strip()
-            if sentence:
-                groups[key]["sentences"].append(sentence)
-
+def _finalize_interactions(groups: dict[tuple, list]) -> list[dict]:
+    """Turn the aggregated interaction groups into response rows, best score first."""
     result = []
     for g in groups.values():
         result.append({
-            "entity_a": g["entity_a"],
-            "type_a": g["type_a"],
-            "id_a": g["id_a"],
-            "entity_b": g["entity_b"],
-            "type_b": g["type_b"],
-            "id_b": g["id_b"],
-            "effect": g["effect"],
-            "mechanism": g["mechanism"],
-            "score": round(g["score"], 3),
-            "pmids": sorted(g["pmids"]),
-            "sentences": g["sentences"][:3],
-            "signor_id": g["signor_id"],
+            "entity_a": g[_G_ENTITY_A],
+            "type_a": g[_G_TYPE_A],
+            "id_a": g[_G_ID_A],
+            "entity_b": g[_G_ENTITY_B],
+            "type_b": g[_G_TYPE_B],
+            "id_b": g[_G_ID_B],
+            "effect": g[_G_EFFECT],
+            "mechanism": g[_G_MECHANISM],
+            "score": round(g[_G_SCORE], 3),
+            "pmids": sorted(g[_G_PMIDS]),
+            "sentences": g[_G_SENTENCES],
+            "signor_id": g[_G_SIGNOR_ID],
         })
 
     result.sort(key=lambda x: x["score"], reverse=True)
     return result
 
 
-def _build_modifications(rows: list[dict], accession: str) -> list[dict]:
-    """
-    Extract unique modification sites where the queried protein is the target
-    (entity_b) and residue + mechanism are present.
-    """
-    seen = set()
-    mods = []
-
-    for row in rows:
-        if row["id_b"] != accession:
-            continue
-        residue = row.get("residue", "").strip()
-        mechanism = row.get("mechanism", "").strip()
-        if not residue or not mechanism:
-            continue
-
-        dedup_key = (row["entity_a"], residue, mechanism)
-        if dedup_key in seen:
-            continue
-        seen.add(dedup_key)
-
-        mods.append({
-            "modifier": row["entity_a"],
-            "residue": residue,
-            "sequence": row.get("sequence", "").strip(),
-            "effect": row.get("effect", "").strip(),
-            "mechanism": mechanism,
-        })
-
-    return mods
-
-
 def _safe_float(val: str) -> float:
     try:
         return float(val.strip())